@@ -7,18 +7,21 @@ be implemented incrementally.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from itertools import cycle
+from functools import lru_cache
+from itertools import islice, repeat
+import json
+import os
 import re
+import tempfile
 from pathlib import Path
-from typing import Dict, Iterator, Sequence
-
-import yaml
+from typing import Dict, Iterable, Iterator, Sequence
 
 
 DEFAULT_CONFIG_PATH = Path("config/workflow.yaml")
+_PILLAR_WORD_RE = re.compile(r"[A-Za-z0-9]+")
 
 
-@dataclass
+@dataclass(slots=True)
 class Prompt:
     """Represents a creative prompt sourced from Google Sheets or local files."""
 
@@ -38,13 +41,13 @@ class Prompt:
         return cls(title=title, hook=hook, call_to_action=call_to_action.strip())
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkflowConfig:
     """Subset of workflow settings used by the caption generator."""
 
     project_name: str
-    content_pillars: Sequence[str]
-    default_hashtags: Sequence[str]
+    content_pillars: tuple[str, ...]
+    default_hashtags: tuple[str, ...]
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "WorkflowConfig":
@@ -57,13 +60,71 @@ class WorkflowConfig:
         return cls(project_name=project_name, content_pillars=content_pillars, default_hashtags=default_hashtags)
 
 
+def _config_cache_path(config_path: Path) -> Path:
+    return config_path.with_name(config_path.name + ".cache.json")
+
+
+def _read_config_cache(cache_path: Path, source_stamp: list[int]) -> object | None:
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    # Only an exact match counts: restored backups can carry an older mtime.
+    if not isinstance(cached, dict) or cached.get("source") != source_stamp:
+        return None
+    return cached.get("data")
+
+
+def _write_config_cache(cache_path: Path, source_stamp: list[int], data: Dict[str, object]) -> None:
+    try:
+        payload = json.dumps({"source": source_stamp, "data": data})
+    except (TypeError, ValueError):
+        return  # YAML-only types (dates, sets) cannot round-trip through JSON.
+
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=cache_path.name, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fp:
+            fp.write(payload)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
 def load_workflow_config(config_path: Path = DEFAULT_CONFIG_PATH) -> WorkflowConfig:
-    """Parse the YAML workflow configuration file."""
+    """Parse the YAML workflow configuration file.
+
+    The parsed mapping is cached in a ``<name>.cache.json`` sidecar together
+    with the YAML's modification time and size, and reused only while both
+    still match the source exactly. It is also memoised in-process under the
+    same key; a fresh config is built from it on every call.
+    """
+
+    stat = config_path.stat()
+    data = _load_workflow_data(str(config_path.absolute()), stat.st_mtime_ns, stat.st_size)
+    return WorkflowConfig.from_dict(data)
+
 
-    data = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+@lru_cache(maxsize=8)
+def _load_workflow_data(path: str, mtime_ns: int, size: int) -> Dict[str, object]:
+    # mtime_ns and size key both this cache and the JSON sidecar, so edits invalidate them.
+    config_path = Path(path)
+    cache_path = _config_cache_path(config_path)
+    source_stamp = [mtime_ns, size]
+    data = _read_config_cache(cache_path, source_stamp)
+    if data is None:
+        # Imported lazily: a warm JSON sidecar means PyYAML is never needed.
+        import yaml
+
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # CSafeLoader requires libyaml
+        data = yaml.load(config_path.read_bytes(), Loader=loader)
+        if isinstance(data, dict):
+            _write_config_cache(cache_path, source_stamp, data)
     if not isinstance(data, dict):  # pragma: no cover - sanity guard
         raise ValueError("Workflow configuration must be a mapping.")
-    return WorkflowConfig.from_dict(data)
+    return data
 
 
 def load_prompts(csv_path: Path) -> Iterator[Prompt]:
@@ -71,34 +132,105 @@ def load_prompts(csv_path: Path) -> Iterator[Prompt]:
     import csv
 
     with csv_path.open("r", encoding="utf-8") as fp:
-        reader = csv.DictReader(fp)
-        if reader.fieldnames is None:
+        reader = csv.reader(fp)
+        header = next(reader, None)
+        if header is None:
             raise ValueError("Prompt CSV must include a header row.")
 
-        normalized_headers = {name.strip().lower(): name for name in reader.fieldnames if name}
-        required = {"title", "hook"}
-        optional_aliases = {"call_to_action", "cta"}
-        if not required.issubset(normalized_headers):
-            raise ValueError("Prompt CSV must contain 'title' and 'hook' columns.")
+        yield from _prompts_from_rows(reader, _prompt_columns(header))
 
-        for row in reader:
-            if not any(value and value.strip() for value in row.values()):
-                continue
 
-            first_value = next((value.strip() for value in row.values() if value and value.strip()), "")
-            if first_value.startswith("#"):
-                continue
+def load_prompts_arrow(csv_path: Path) -> list[Prompt]:
+    """Load prompts with pyarrow's multithreaded CSV reader.
 
-            normalized_row = {key.strip().lower(): (value or "") for key, value in row.items()}
-            mapping: Dict[str, str] = {field: normalized_row.get(field, "") for field in required}
-            for alias in optional_aliases:
-                if alias in normalized_row:
-                    mapping[alias] = normalized_row[alias]
-            yield Prompt.from_mapping(mapping)
+    Suited to large exports; falls back to :func:`load_prompts` when pyarrow is
+    not installed. Unlike the ``csv`` path, every row other than blank lines
+    and ``#`` comments must have as many fields as the header.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return list(load_prompts(csv_path))
+    import csv
 
+    with csv_path.open("r", encoding="utf-8") as fp:
+        header = next(csv.reader(fp), None)
+    if header is None:
+        raise ValueError("Prompt CSV must include a header row.")
+    columns = _prompt_columns(header)
+
+    def _skip_comment_row(row: pacsv.InvalidRow) -> str:
+        text = row.text.strip()
+        return "skip" if not text or text.startswith("#") else "error"
+
+    table = pacsv.read_csv(
+        csv_path,
+        # Arrow parses the header itself: skip_rows counts physical lines, which
+        # would split a header whose quoted field spans several lines.
+        read_options=pacsv.ReadOptions(),
+        parse_options=pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=_skip_comment_row),
+        convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in header}),
+    )
 
+    # Strip and filter inside Arrow; only the three prompt fields reach Python.
+    cells = [pc.utf8_trim_whitespace(column) for column in table.columns]
+    seen = pa.repeat(False, table.num_rows)
+    comment = seen
+    for cell in cells:
+        nonblank = pc.not_equal(cell, "")
+        first = pc.and_(nonblank, pc.invert(seen))
+        comment = pc.or_(comment, pc.and_(first, pc.starts_with(cell, "#")))
+        seen = pc.or_(seen, nonblank)
+    keep = pc.and_(seen, pc.invert(comment))
+
+    titles = pc.filter(cells[columns["title"]], keep).to_pylist()
+    hooks = pc.filter(cells[columns["hook"]], keep).to_pylist()
+    ctas: Iterable[str] = repeat("")
+    cta_cells = [cells[columns[name]] for name in ("call_to_action", "cta") if name in columns]
+    if cta_cells:
+        cta = cta_cells[0]
+        if len(cta_cells) == 2:
+            cta = pc.if_else(pc.not_equal(cta, ""), cta, cta_cells[1])
+        ctas = pc.filter(cta, keep).to_pylist()
+    return [Prompt(title, hook, call_to_action) for title, hook, call_to_action in zip(titles, hooks, ctas)]
+
+
+def _prompt_columns(header: Sequence[str]) -> Dict[str, int]:
+    columns = {name.strip().lower(): index for index, name in enumerate(header) if name}
+    if "title" not in columns or "hook" not in columns:
+        raise ValueError("Prompt CSV must contain 'title' and 'hook' columns.")
+    return columns
+
+
+def _prompts_from_rows(rows: Iterable[Sequence[str]], columns: Dict[str, int]) -> Iterator[Prompt]:
+    title_index = columns["title"]
+    hook_index = columns["hook"]
+    cta_index = columns.get("call_to_action")
+    cta_alias_index = columns.get("cta")
+
+    for row in rows:
+        first_value = next((value for value in row if value and not value.isspace()), None)
+        if first_value is None or first_value.lstrip().startswith("#"):
+            continue
+
+        yield Prompt(
+            title=_cell(row, title_index),
+            hook=_cell(row, hook_index),
+            call_to_action=_cell(row, cta_index) or _cell(row, cta_alias_index),
+        )
+
+
+def _cell(row: Sequence[str], index: int | None) -> str:
+    if index is None or index >= len(row):
+        return ""
+    return row[index].strip()
+
+
+@lru_cache(maxsize=None)
 def _pillar_hashtag(pillar: str) -> str:
-    words = re.findall(r"[A-Za-z0-9]+", pillar)
+    words = _PILLAR_WORD_RE.findall(pillar)
     if not words:
         return "#Content"
     return "#" + "".join(word.capitalize() for word in words)
@@ -111,33 +243,38 @@ def generate_caption(prompt: Prompt, pillar: str, config: WorkflowConfig) -> str
     template close to production output.
     """
 
-    hashtags = [_pillar_hashtag(pillar)] + list(config.default_hashtags)
-    lines = [prompt.hook]
-    if prompt.call_to_action:
-        lines.extend(["", prompt.call_to_action])
-    lines.extend(["", f"Hashtags: {' '.join(tag for tag in hashtags if tag)}"])
-    return "\n".join(lines)
+    return _render_caption(prompt, _pillar_hashtag(pillar), _default_hashtag_tail(config))
+
+
+def _default_hashtag_tail(config: WorkflowConfig) -> str:
+    # Blank tags are dropped here, once per save_captions call.
+    return " ".join(tag for tag in config.default_hashtags if tag)
+
+
+def _render_caption(prompt: Prompt, pillar_tag: str, default_tail: str) -> str:
+    body = f"{prompt.hook}\n\n{prompt.call_to_action}" if prompt.call_to_action else prompt.hook
+    hashtag_line = "Hashtags: " + pillar_tag + (" " + default_tail if default_tail else "")
+    return f"{body}\n\n{hashtag_line}"
 
 
 def save_captions(prompts: Sequence[Prompt], output_path: Path, config: WorkflowConfig) -> None:
     """Write generated captions to a Markdown file for manual review."""
 
-    lines = ["# Generated Captions", ""]
-    pillar_cycle = cycle(config.content_pillars)
-    for prompt in prompts:
-        pillar = next(pillar_cycle)
-        caption = generate_caption(prompt, pillar, config)
-        lines.append(f"## {prompt.title}")
-        lines.append(f"**Pillar:** {pillar}")
-        lines.append("")
-        lines.append(caption)
-        if prompt.call_to_action:
-            lines.append("")
-            lines.append(f"**Call to Action:** {prompt.call_to_action}")
-        lines.append("")
-
-    output = "\n".join(lines).strip() + "\n"
-    output_path.write_text(output, encoding="utf-8")
+    default_tail = _default_hashtag_tail(config)
+    # Only the first len(prompts) pillars are ever reached by the rotation.
+    pillars = tuple(islice(config.content_pillars, len(prompts)))
+    pillar_tags = tuple(_pillar_hashtag(pillar) for pillar in pillars)
+    pillar_count = len(pillars)
+    with output_path.open("w", encoding="utf-8", buffering=1 << 16) as fp:
+        fp.write("# Generated Captions\n")
+        for index, prompt in enumerate(prompts):
+            slot = index % pillar_count
+            pillar = pillars[slot]
+            caption = _render_caption(prompt, pillar_tags[slot], default_tail)
+            # Blocks lead with their blank separator so nothing trails the last one.
+            fp.write(f"\n## {prompt.title}\n**Pillar:** {pillar}\n\n{caption}\n")
+            if prompt.call_to_action:
+                fp.write(f"\n**Call to Action:** {prompt.call_to_action}\n")
 
 
 def run(csv_path: Path, output_path: Path, config_path: Path | None = None) -> None:
@@ -1,20 +1,38 @@
+import dataclasses
+import os
 from pathlib import Path
+import shutil
 import sys
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from scripts.caption_pipeline import (  # noqa: E402
     DEFAULT_CONFIG_PATH,
+    Prompt,
+    WorkflowConfig,
+    _load_workflow_data,
     generate_caption,
     load_prompts,
+    load_prompts_arrow,
     load_workflow_config,
     run,
+    save_captions,
 )
 
 
-def test_run_generates_markdown(tmp_path: Path) -> None:
+@pytest.fixture
+def config_path(tmp_path: Path) -> Path:
+    # Load a copy so the JSON sidecar is written under tmp_path, not config/.
+    path = tmp_path / DEFAULT_CONFIG_PATH.name
+    shutil.copy(ROOT / DEFAULT_CONFIG_PATH, path)
+    return path
+
+
+def test_run_generates_markdown(tmp_path: Path, config_path: Path) -> None:
     csv_path = tmp_path / "prompts.csv"
     csv_path.write_text(
         "title,hook,cta\nMoon Magic,Unveil lunar secrets,Follow for nightly rituals\n",
@@ -22,7 +40,7 @@ def test_run_generates_markdown(tmp_path: Path) -> None:
     )
 
     output_path = tmp_path / "captions.md"
-    run(csv_path, output_path)
+    run(csv_path, output_path, config_path)
 
     content = output_path.read_text(encoding="utf-8")
     assert "# Generated Captions" in content
@@ -47,8 +65,50 @@ def test_load_prompts_handles_aliases(tmp_path: Path) -> None:
     assert prompt.call_to_action == "Invite followers to share their myth"
 
 
-def test_generate_caption_uses_config_hashtags() -> None:
-    config = load_workflow_config(DEFAULT_CONFIG_PATH)
+def test_load_prompts_skips_comments_and_pads_short_rows(tmp_path: Path) -> None:
+    csv_path = tmp_path / "prompts.csv"
+    csv_path.write_text(
+        "title,hook,cta\n# draft ideas\n,,\n Night Sky , Look up \n",
+        encoding="utf-8",
+    )
+
+    prompts = list(load_prompts(csv_path))
+
+    assert prompts == [Prompt(title="Night Sky", hook="Look up", call_to_action="")]
+
+
+def test_load_prompts_arrow_matches_csv_loader(tmp_path: Path) -> None:
+    pytest.importorskip("pyarrow")
+    csv_path = tmp_path / "prompts.csv"
+    csv_path.write_text(
+        'Title,Hook,CTA,"Notes\n(internal)"\n'
+        "# draft ideas\n"
+        ",,,\n"
+        'Star Stories,"Lead with\ncuriosity",Share a myth,\n'
+        " 42 , Count down ,,7\n",
+        encoding="utf-8",
+    )
+
+    prompts = load_prompts_arrow(csv_path)
+
+    assert prompts == list(load_prompts(csv_path))
+    assert prompts == [
+        Prompt(title="Star Stories", hook="Lead with\ncuriosity", call_to_action="Share a myth"),
+        Prompt(title="42", hook="Count down", call_to_action=""),
+    ]
+
+
+def test_load_prompts_arrow_falls_back_without_pyarrow(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    monkeypatch.setitem(sys.modules, "pyarrow.csv", None)
+    csv_path = tmp_path / "prompts.csv"
+    csv_path.write_text("title,hook\n# draft ideas\nShort Row\n", encoding="utf-8")
+
+    assert load_prompts_arrow(csv_path) == [Prompt(title="Short Row", hook="", call_to_action="")]
+
+
+def test_generate_caption_uses_config_hashtags(config_path: Path) -> None:
+    config = load_workflow_config(config_path)
     prompt = next(iter(load_prompts(Path(__file__).parent / "fixtures" / "single_prompt.csv")))
     caption = generate_caption(prompt, config.content_pillars[0], config)
 
@@ -57,6 +117,92 @@ def test_generate_caption_uses_config_hashtags() -> None:
         assert tag in caption
 
 
-def test_load_workflow_config_reads_project_name() -> None:
-    config = load_workflow_config(DEFAULT_CONFIG_PATH)
+def test_generate_caption_skips_blank_default_hashtags() -> None:
+    config = WorkflowConfig(project_name="demo", content_pillars=("Moon",), default_hashtags=("", "#x"))
+    prompt = Prompt(title="Night", hook="Look up", call_to_action="")
+
+    assert generate_caption(prompt, "Moon", config) == "Look up\n\nHashtags: #Moon #x"
+
+
+def test_load_workflow_config_reads_project_name(config_path: Path) -> None:
+    config = load_workflow_config(config_path)
     assert config.project_name == "content-automation"
+
+
+def test_workflow_config_is_frozen_and_hashable(config_path: Path) -> None:
+    config = load_workflow_config(config_path)
+
+    assert hash(config) == hash(dataclasses.replace(config))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.project_name = "renamed"  # type: ignore[misc]
+
+
+def test_load_workflow_config_refreshes_json_sidecar(tmp_path: Path) -> None:
+    config_path = tmp_path / "workflow.yaml"
+    config_path.write_text("project:\n  name: first\n", encoding="utf-8")
+
+    first = load_workflow_config(config_path)
+    assert first.project_name == "first"
+    assert load_workflow_config(config_path) == first
+    assert (tmp_path / "workflow.yaml.cache.json").exists()
+
+    config_path.write_text("project:\n  name: seconds\n", encoding="utf-8")
+    assert load_workflow_config(config_path).project_name == "seconds"
+
+    # Restoring an older backup (cp -p, tar, rsync) moves the mtime backwards.
+    backup_path = tmp_path / "backup.yaml"
+    backup_path.write_text("project:\n  name: restore\n", encoding="utf-8")
+    older = config_path.stat().st_mtime_ns - 60_000_000_000
+    os.utime(backup_path, ns=(older, older))
+    os.replace(backup_path, config_path)
+
+    assert load_workflow_config(config_path).project_name == "restore"
+
+
+def test_load_workflow_config_reads_warm_sidecar_without_yaml(
+    config_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    load_workflow_config(config_path)
+    assert (config_path.parent / "workflow.yaml.cache.json").exists()
+
+    _load_workflow_data.cache_clear()
+    monkeypatch.setitem(sys.modules, "yaml", None)
+
+    assert load_workflow_config(config_path).project_name == "content-automation"
+
+
+def test_save_captions_writes_expected_markdown(tmp_path: Path) -> None:
+    config = WorkflowConfig(
+        project_name="demo",
+        content_pillars=("Garden & Moon", "Poetic Pairings"),
+        default_hashtags=("#Daily",),
+    )
+    prompts = [
+        Prompt(title="First", hook="Open strong", call_to_action="Follow along"),
+        Prompt(title="Second", hook="Keep going", call_to_action=""),
+    ]
+
+    output_path = tmp_path / "captions.md"
+    save_captions(prompts, output_path, config)
+
+    assert output_path.read_text(encoding="utf-8") == (
+        "# Generated Captions\n"
+        "\n"
+        "## First\n"
+        "**Pillar:** Garden & Moon\n"
+        "\n"
+        "Open strong\n"
+        "\n"
+        "Follow along\n"
+        "\n"
+        "Hashtags: #GardenMoon #Daily\n"
+        "\n"
+        "**Call to Action:** Follow along\n"
+        "\n"
+        "## Second\n"
+        "**Pillar:** Poetic Pairings\n"
+        "\n"
+        "Keep going\n"
+        "\n"
+        "Hashtags: #PoeticPairings #Daily\n"
+    )